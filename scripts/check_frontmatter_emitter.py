@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Emitter Regression Check
+
+sync_member_posts._emit_frontmatter writes the common frontmatter shapes with string templates
+instead of yaml.dump. Synced index.qmd files are compared byte for byte, so any difference from
+yaml.dump rewrites already-synced publications. This script fuzzes random frontmatter mappings
+(including the plain scalar, line width and key length boundaries) and reports every mismatch.
+
+Usage:
+    python scripts/check_frontmatter_emitter.py [--cases N] [--seed SEED]
+"""
+
+import argparse
+import random
+import string
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from sync_member_posts import _emit_frontmatter  # noqa: E402
+
+ALPHABET = string.ascii_letters + string.digits + " _./:()@+,*&!%'\"?[]{}|>~=;-#\té×ÀŸ’中🧬"
+
+# Lengths around PyYAML's 80 column line width and 123/128 character simple key limits
+LENGTHS = [0, 1, 2, 3, 5, 10, 20, 40, 70, 78, 79, 80, 81, 90, 120, 122, 123, 124, 127, 128]
+
+# Strings PyYAML resolves to other types or has to quote
+SPECIAL_STRINGS = [
+    'null', 'yes', 'No', 'on', '1.0', '1e3', '0x1F', '2020-01-01', '~', '12:30', '1_000', '.inf',
+    '-', 'a: b', 'a:', 'a #b', 'a# b', '  x', 'x ', '=', '<<', 'true', 'False', '0o7', '+1', '.5',
+    '1:2:3', 'x' * 122, 'x' * 123, 'x' * 200, ('word ' * 30).strip(), 'a' * 78 + ' b',
+    'Résumé of things', 'ÀÁ', 'ŸŸ', 'e×f', '🧬 Genomics'
+]
+
+def random_string(rng: random.Random) -> str:
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.choice(LENGTHS)))
+
+def random_scalar(rng: random.Random) -> str:
+    return rng.choice(SPECIAL_STRINGS) if rng.random() < 0.3 else random_string(rng)
+
+def random_value(rng: random.Random, depth: int = 0):
+    r = rng.random()
+    if r < 0.5:
+        return random_scalar(rng)
+    if r < 0.55:
+        return rng.choice([None, True, False, 0, -3, 10 ** 20, 1.5])
+    if r < 0.75 and depth < 2:
+        return [random_scalar(rng) if rng.random() < 0.9 else random_value(rng, depth + 1)
+                for _ in range(rng.randint(0, 4))]
+    if depth < 2:
+        return {random_scalar(rng) or 'k': random_scalar(rng) if rng.random() < 0.9 else random_value(rng, depth + 1)
+                for _ in range(rng.randint(0, 4))}
+    return random_string(rng)
+
+def random_frontmatter(rng: random.Random) -> dict:
+    keys = ['title', 'author', 'categories', 'source', 'date']
+    return {rng.choice(keys) if rng.random() < 0.5 else random_scalar(rng) or 'k': random_value(rng)
+            for _ in range(rng.randint(1, 6))}
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare _emit_frontmatter against yaml.dump on fuzzed frontmatter')
+    parser.add_argument('--cases', type=int, default=20000, help='Number of random frontmatters to check')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mismatches = 0
+    for _ in range(args.cases):
+        frontmatter = random_frontmatter(rng)
+        expected = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+        actual = _emit_frontmatter(frontmatter)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"Mismatch for {frontmatter!r}\n  yaml.dump: {expected!r}\n  emitter:   {actual!r}")
+
+    print(f"{mismatches} mismatches in {args.cases} cases")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
@@ -9,20 +9,45 @@ Usage:
     python sync_member_posts.py [--dry-run] [--member USERNAME]
 """
 
+import io
 import os
 import sys
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import base64
+import binascii
+import hashlib
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 from datetime import datetime
 import argparse
 import logging
 import re
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+# Prefer the libyaml C loader; fall back to the pure Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Frontmatter is always written with the pure Python dumper: libyaml escapes characters
+# outside the BMP (emoji) and wraps long quoted scalars differently, which would rewrite
+# every previously synced publication
+from yaml import SafeDumper
+
+# Prefer orjson for decoding GitHub API responses; fall back to the standard library
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,24 +55,238 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent HTTP requests issued per fan-out (directories, image probes)
+MAX_WORKERS = 16
+
+# Members synced at once; each runs its own MAX_WORKERS fan-outs
+MEMBER_WORKERS = 4
+
+# Connections kept alive per host, enough for every member's fan-out at once
+POOL_MAXSIZE = MEMBER_WORKERS * MAX_WORKERS
+
+# Chunk size used when streaming image downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Buffer size used when writing index.qmd files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Hosts the sync talks to; each gets a pooled, retrying adapter
+GITHUB_HOSTS = ('https://api.github.com', 'https://raw.githubusercontent.com')
+
+# Featured image file names, in the order they are probed when no listing is available
+IMAGE_EXTENSIONS = ('jpg', 'jpeg', 'png', 'gif', 'svg')
+FEATURED_IMAGE_RE = re.compile(r'^featured\.(?:png|jpe?g|gif|svg)$', re.IGNORECASE)
+
+# YAML frontmatter block at the start of a .qmd file, followed by the markdown body
+FRONTMATTER_RE = re.compile(r'\A---[ \t]*\r?\n(?:(.*?)\r?\n)?---[ \t]*(?:\r?\n|\Z)(.*)\Z', re.DOTALL)
+
+# GitHub rate limit handling: pause API requests once this few remain before the reset,
+# retry rate-limited responses a few times, and never wait longer than MAX_RATE_LIMIT_WAIT
+# seconds (longer waits fall through to the raw GitHub fallback instead)
+RATE_LIMIT_MIN_REMAINING = 1
+MAX_RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 60
+
+# Strings that PyYAML would emit as-is (unquoted, on one line); anything else goes through yaml.dump
+PLAIN_SCALAR_RE = re.compile(r'^[A-Za-z0-9_/(\u00c0-\u024f][A-Za-z0-9 _./:()@+,*&!%\'"?\[\]{}|>~=;\u00c0-\u024f\-]*\Z')
+PLAIN_SCALAR_MAX_WIDTH = 80
+# Keys this long or longer are written by PyYAML as explicit '? key' entries (its simple key
+# limit of 128 characters also counts the 5 character '!!str' tag it prepares for the key)
+PLAIN_KEY_MAX_LENGTH = 128 - len('!!str')
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+# Sidecar file persisting ETags and directory SHAs between sync runs
+DEFAULT_CACHE_PATH = ".sync_cache.json"
+CACHE_SECTIONS = ('responses', 'directories', 'trees', 'files')
+
+@dataclass(slots=True)
+class MemberContext:
+    """Per-member values derived once and shared by all of that member's publications."""
+    member: Dict
+    username: str
+    repo_name: str
+    branch: str
+    publications_path: str
+    api_base_url: str
+    raw_base_url: str
+    html_base_url: str
+    local_dir_prefix: str
+    attribution: str
+
+def _as_list(value) -> List:
+    """Wrap a scalar frontmatter value in a list (None becomes an empty list)."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def _load_yaml(stream):
+    """Parse a single YAML document with the (C) safe loader."""
+    loader = SafeLoader(stream)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+def _dump_yaml(data) -> str:
+    """Serialise data in block style with the safe dumper."""
+    stream = io.StringIO()
+    dumper = SafeDumper(stream, default_flow_style=False, allow_unicode=True)
+    try:
+        dumper.open()
+        dumper.represent(data)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    return stream.getvalue()
+
+def _is_plain_scalar(value, column: int = 0, key: bool = False) -> bool:
+    """Whether a string written at ``column`` is emitted by PyYAML as an unquoted single-line scalar.
+    
+    Mapping keys (``key=True``) must also be short enough for PyYAML's simple ``key: value`` form.
+    """
+    return (
+        isinstance(value, str)
+        and (not key or len(value) < PLAIN_KEY_MAX_LENGTH)
+        and PLAIN_SCALAR_RE.match(value) is not None
+        and ': ' not in value
+        and not value.endswith((':', ' '))
+        # PyYAML only wraps at spaces once a line runs past its 80 column width
+        and (' ' not in value or column + len(value) <= PLAIN_SCALAR_MAX_WIDTH)
+        # Strings that would read back as another type (numbers, booleans, dates) get quoted
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == 'tag:yaml.org,2002:str'
+    )
+
+def _emit_frontmatter(frontmatter: Dict) -> str:
+    """Emit frontmatter YAML in the block style of ``yaml.dump(..., default_flow_style=False)``.
+    
+    The known shapes (plain strings, null/boolean/integer scalars, lists of strings, and the
+    flat ``source`` mapping) are written with string templates, but only where
+    ``_is_plain_scalar`` judges PyYAML would also write every key and string unquoted on
+    one line; any other value is handed to ``_dump_yaml``.
+    
+    Each key is emitted on its own, so values shared through YAML aliases (``tags: &t [...]``,
+    ``keywords: *t``) are written out in full under every key instead of as ``&id001``/``*id001``.
+    ``scripts/check_frontmatter_emitter.py`` compares the output against ``yaml.dump``.
+    """
+    try:
+        keys = sorted(frontmatter)
+    except TypeError:
+        # Mixed key types: keep insertion order, as yaml.dump does
+        keys = list(frontmatter)
+    
+    lines = []
+    for key in keys:
+        value = frontmatter[key]
+        column = len(key) + 2 if isinstance(key, str) else 0
+        if _is_plain_scalar(key, key=True):
+            if value is None:
+                lines.append(f"{key}: null\n")
+                continue
+            if isinstance(value, bool):
+                lines.append(f"{key}: {'true' if value else 'false'}\n")
+                continue
+            if isinstance(value, int):
+                lines.append(f"{key}: {value}\n")
+                continue
+            if _is_plain_scalar(value, column):
+                lines.append(f"{key}: {value}\n")
+                continue
+            if isinstance(value, list) and value and all(_is_plain_scalar(item, 2) for item in value):
+                lines.append(f"{key}:\n")
+                lines.extend(f"- {item}\n" for item in value)
+                continue
+            if (isinstance(value, dict) and value
+                    and all(_is_plain_scalar(k, 2, key=True) and _is_plain_scalar(v, len(k) + 4) for k, v in value.items())):
+                lines.append(f"{key}:\n")
+                lines.extend(f"  {k}: {value[k]}\n" for k in sorted(value))
+                continue
+        lines.append(_dump_yaml({key: value}))
+    return ''.join(lines)
+
+def _append_missing(items: List, extra: List) -> List:
+    """Return ``items`` followed by each ``extra`` value not already present.
+    
+    Duplicates already in ``items`` are kept. Membership is checked against a set, falling back
+    to a list scan for unhashable values (such as a mapping in ``categories``).
+    """
+    merged = list(items)
+    seen = set()
+    for item in merged:
+        try:
+            seen.add(item)
+        except TypeError:
+            pass
+    for item in extra:
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            if item in merged:
+                continue
+        merged.append(item)
+    return merged
+
+def _content_hash(content: str) -> str:
+    """Hash publication content the same way it is compared (ignoring surrounding whitespace)."""
+    return hashlib.blake2b(content.strip().encode('utf-8'), digest_size=16).hexdigest()
+
 class MemberPostSync:
-    def __init__(self, config_path: str = "members.yml", dry_run: bool = False):
+    def __init__(self, config_path: str = "members.yml", dry_run: bool = False,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         self.config_path = config_path
         self.dry_run = dry_run
+        self.cache_path = Path(cache_path) if cache_path else None
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'McPhersonLab-PostSync/1.0'
+            'User-Agent': 'McPhersonLab-PostSync/1.0',
+            'Connection': 'keep-alive'
         })
         
+        # Authenticated requests get 5000 req/hr instead of 60, avoiding the raw fallback
+        github_token = os.environ.get('GITHUB_TOKEN')
+        if github_token:
+            self.session.headers['Authorization'] = f'Bearer {github_token}'
+        
+        # Reuse connections across concurrent requests and retry transient failures;
+        # rate limiting (403/429, Retry-After) is left to the capped loop in _safe_request
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        # pool_block makes the rarer nested fan-outs (image probes) wait for a free
+        # connection instead of opening extra ones that are discarded afterwards
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, pool_block=True, max_retries=retry)
+        for host in GITHUB_HOSTS:
+            self.session.mount(host, adapter)
+        
         # Load configuration
         self.config = self._load_config()
         self.base_publications_dir = Path("publications")
         
+        # Resolve sync settings once instead of per publication
+        sync_config = self.config.get('sync_config') or {}
+        self._max_posts = sync_config.get('max_posts_per_member', 50)
+        self._add_attribution = sync_config.get('add_attribution', True)
+        
+        # Load the ETag/SHA cache from previous runs, tracking which entries this run uses
+        self.cache = self._load_cache()
+        self._cache_used = {section: set() for section in CACHE_SECTIONS}
+        
+        # Directories already created during this run
+        self._created_dirs = set()
+        
+        # Epoch time at which an exhausted API rate limit resets
+        self._rate_limit_reset = None
+        
     def _load_config(self) -> Dict:
         """Load the members configuration from YAML file."""
         try:
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = _load_yaml(f)
                 logger.info(f"Loaded configuration with {len(config.get('members', []))} members")
                 return config
         except FileNotFoundError:
@@ -57,40 +296,121 @@ class MemberPostSync:
             logger.error(f"Error parsing {self.config_path}: {e}")
             sys.exit(1)
     
-    def _get_posts_from_member_site(self, member: Dict) -> List[Dict]:
-        """Fetch publications from a member's GitHub profile repository via GitHub API."""
+    def _load_cache(self) -> Dict:
+        """Load the sync cache (response ETags and publication directory SHAs)."""
+        cache = {section: {} for section in CACHE_SECTIONS}
+        if not self.cache_path or not self.cache_path.exists():
+            return cache
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache.update(json.load(f))
+            logger.debug(f"Loaded sync cache with {len(cache['responses'])} responses and {len(cache['directories'])} directories")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable sync cache {self.cache_path}: {e}")
+        return cache
+    
+    def _cache_get(self, section: str, key: str) -> Optional[Dict]:
+        """Look up a sync cache entry, marking it as still in use."""
+        self._cache_used[section].add(key)
+        return self.cache[section].get(key)
+    
+    def _cache_put(self, section: str, key: str, entry: Dict) -> None:
+        """Store a sync cache entry, marking it as still in use."""
+        self._cache_used[section].add(key)
+        self.cache[section][key] = entry
+    
+    def _prune_cache(self) -> None:
+        """Drop cache entries this run did not use (renamed or removed URLs, directories and files)."""
+        for section, used in self._cache_used.items():
+            self.cache[section] = {key: entry for key, entry in self.cache[section].items() if key in used}
+    
+    def _save_cache(self) -> None:
+        """Persist the sync cache for the next run."""
+        if not self.cache_path or self.dry_run:
+            return
+        try:
+            tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write sync cache {self.cache_path}: {e}")
+    
+    def _build_member_context(self, member: Dict) -> MemberContext:
+        """Derive the per-member repository URLs and templates used for every publication."""
         username = member['username']
-        publications_path = member.get('publications_path', '/publications').strip('/')
+        repo_name = f"{username}.github.io"
+        api_base_url = f"https://api.github.com/repos/{username}/{repo_name}"
+        branch = self._fetch_default_branch(api_base_url)
+        
+        attribution = ''
+        if self._add_attribution:
+            attribution = f"\n\n---\n\n*This publication was originally published by [{member['name']}]({member['profile_url']}) and automatically synced to the McPherson Lab website.*"
+        
+        return MemberContext(
+            member=member,
+            username=username,
+            repo_name=repo_name,
+            branch=branch,
+            publications_path=member.get('publications_path', '/publications').strip('/'),
+            api_base_url=api_base_url,
+            raw_base_url=f"https://raw.githubusercontent.com/{username}/{repo_name}/{branch}",
+            html_base_url=f"https://github.com/{username}/{repo_name}/blob/{branch}",
+            local_dir_prefix=f"{username.lower()}-",
+            attribution=attribution
+        )
+    
+    def _fetch_default_branch(self, api_base_url: str) -> str:
+        """Return the repository's default branch.
+        
+        The branch ends up in every publication's source URL, so when the API is unavailable the
+        branch seen on an earlier run is reused (falling back to main) rather than churning them.
+        """
+        status, body = self._get_content(api_base_url)
+        if status != 200:
+            cached = self._cache_get('responses', api_base_url)
+            body = cached['body'].encode('utf-8') if cached else b'{}'
+        return json_loads(body).get('default_branch') or 'main'
+    
+    def _get_posts_from_member_site(self, ctx: MemberContext) -> List[Dict]:
+        """Fetch publications from a member's GitHub profile repository via GitHub API."""
+        username = ctx.username
         
         logger.info(f"Fetching publications for {username} from GitHub API")
         
         posts = []
         try:
+            # One recursive tree listing replaces the per-directory walk when available
+            tree = self._fetch_repo_tree(ctx)
+            if tree is not None:
+                posts = self._get_posts_from_tree(tree, ctx)
+                logger.info(f"Found {len(posts)} publications for {username}")
+                return posts
+            
             # Use GitHub API to get publications from the member's repository
-            repo_name = f"{username}.github.io"
-            api_url = f"https://api.github.com/repos/{username}/{repo_name}/contents/{publications_path}"
+            api_url = f"{ctx.api_base_url}/contents/{ctx.publications_path}"
             
             logger.debug(f"API URL: {api_url}")
-            response = self._safe_request(api_url)
+            status, body = self._get_content(api_url)
             
-            if response and response.status_code == 200:
-                posts = self._parse_posts_from_github_api(response.json(), username, repo_name, publications_path, member)
-            elif response:
-                logger.warning(f"GitHub API returned status {response.status_code} for {username}/{repo_name}")
-                if response.status_code == 404:
+            if status == 200:
+                posts = self._parse_posts_from_github_api(json_loads(body), ctx)
+            elif status is not None:
+                logger.warning(f"GitHub API returned status {status} for {username}/{ctx.repo_name}")
+                if status == 404:
                     logger.info(f"Publications directory not found for {username} - this is normal if they don't have publications yet")
-                elif response.status_code == 403:
-                    logger.warning(f"Access denied to GitHub API. Response: {response.text}")
+                elif status == 403:
+                    logger.warning(f"Access denied to GitHub API. Response: {body.decode('utf-8', 'replace')}")
                     # Try using raw GitHub content instead
                     logger.info("Falling back to raw GitHub content fetch")
-                    posts = self._get_posts_via_raw_github(username, publications_path, member)
+                    posts = self._get_posts_via_raw_github(ctx)
                 else:
-                    logger.warning(f"Response: {response.text}")
+                    logger.warning(f"Response: {body.decode('utf-8', 'replace')}")
             else:
                 logger.warning(f"Could not fetch posts for {username}")
                 # Try fallback even if no response
                 logger.info("Trying raw GitHub content fallback")
-                posts = self._get_posts_via_raw_github(username, publications_path, member)
+                posts = self._get_posts_via_raw_github(ctx)
                 
         except Exception as e:
             logger.error(f"Error fetching publications for {username}: {e}")
@@ -98,156 +418,427 @@ class MemberPostSync:
         logger.info(f"Found {len(posts)} publications for {username}")
         return posts
     
-    def _get_posts_via_raw_github(self, username: str, publications_path: str, member: Dict) -> List[Dict]:
+    def _fetch_repo_tree(self, ctx: MemberContext) -> Optional[List[Dict]]:
+        """Fetch the recursive git tree of the member repository.
+        
+        Returns None when the tree listing is unavailable so callers can fall back to
+        walking the contents API.
+        """
+        tree_url = f"{ctx.api_base_url}/git/trees/{ctx.branch}?recursive=1"
+        status, body = self._get_content(tree_url)
+        if status != 200:
+            logger.debug(f"Could not fetch repository tree for {ctx.username}/{ctx.repo_name}")
+            return None
+        
+        tree_data = json_loads(body)
+        if tree_data.get('truncated'):
+            logger.debug(f"Repository tree for {ctx.username}/{ctx.repo_name} is truncated")
+            return None
+        
+        return tree_data.get('tree', [])
+    
+    def _get_posts_from_tree(self, tree: List[Dict], ctx: MemberContext) -> List[Dict]:
+        """Build publications from a repository tree, fetching only directories whose SHA changed."""
+        tree_key = f"{ctx.username}/{ctx.repo_name}/{ctx.publications_path}"
+        
+        publications_sha = next(
+            (entry['sha'] for entry in tree if entry['type'] == 'tree' and entry['path'] == ctx.publications_path),
+            None
+        )
+        if publications_sha is None:
+            logger.info(f"Publications directory not found for {ctx.username} - this is normal if they don't have publications yet")
+            return []
+        
+        # Nothing under the publications directory changed since the last run
+        cached_tree = self._cache_get('trees', tree_key)
+        if cached_tree and cached_tree['sha'] == publications_sha:
+            publications = [self._cached_publication(ctx, name, sha) for name, sha in cached_tree['directories'].items()]
+            if all(publications):
+                logger.info(f"Publications for {ctx.username} unchanged since last sync")
+                return publications
+        
+        directories = self._list_publication_directories(tree, ctx)
+        logger.info(f"Found {len(directories)} publication directories in {ctx.username}/{ctx.repo_name} tree")
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda dir_name: self._fetch_publication_via_raw_github(
+                    dir_name, ctx, directories[dir_name]['images'], directory_sha=directories[dir_name]['sha']
+                ),
+                directories
+            )
+            publications = [publication for publication in results if publication]
+        
+        # Only remember the tree once every directory made it into the cache
+        if len(publications) == len(directories):
+            self._cache_put('trees', tree_key, {
+                'sha': publications_sha,
+                'directories': {dir_name: info['sha'] for dir_name, info in directories.items()}
+            })
+        
+        return publications
+    
+    def _get_posts_via_raw_github(self, ctx: MemberContext) -> List[Dict]:
         """Alternative method using raw GitHub URLs when API access is limited."""
         publications = []
         
         try:
-            repo_name = f"{username}.github.io"
-            
-            # Try to discover publication directories using known examples
+            # The recursive tree listing is served by api.github.com too, so it is tried up
+            # front in _get_posts_from_member_site; this fallback only runs once the API is
+            # rate limited or unreachable, leaving nothing to list directories with.
             # For fallback, we'll try known directories that we've seen in the member's repo
             known_directories = ['20250917_test']  # Add more as needed
             
-            for dir_name in known_directories:
-                try:
-                    # Try to fetch index.qmd from this directory
-                    index_url = f"https://raw.githubusercontent.com/{username}/{repo_name}/main/{publications_path}/{dir_name}/index.qmd"
-                    logger.debug(f"Trying publication URL: {index_url}")
-                    
-                    response = self._safe_request(index_url)
-                    if response and response.status_code == 200:
-                        content = response.text
-                        
-                        # Parse the publication content
-                        publication_data = self._parse_qmd_content(content, 'index.qmd', member)
-                        if publication_data:
-                            publication_data['directory_name'] = dir_name
-                            publication_data['source_url'] = f"https://github.com/{username}/{repo_name}/blob/main/{publications_path}/{dir_name}/index.qmd"
-                            publication_data['github_path'] = f"{publications_path}/{dir_name}/index.qmd"
-                            publication_data['image_files'] = []
-                            
-                            # Try to find associated image files
-                            image_extensions = ['jpg', 'jpeg', 'png', 'gif', 'svg']
-                            for ext in image_extensions:
-                                img_filename = f"featured.{ext}"
-                                img_url = f"https://raw.githubusercontent.com/{username}/{repo_name}/main/{publications_path}/{dir_name}/{img_filename}"
-                                
-                                # Check if the image exists
-                                img_response = self._safe_request(img_url)
-                                if img_response and img_response.status_code == 200:
-                                    image_info = {
-                                        'name': img_filename,
-                                        'download_url': img_url,
-                                        'github_path': f"{publications_path}/{dir_name}/{img_filename}"
-                                    }
-                                    publication_data['image_files'].append(image_info)
-                                    logger.debug(f"Found image file: {img_filename}")
-                                    break  # Only need one featured image
-                            
-                            publications.append(publication_data)
-                            logger.info(f"Successfully fetched publication {dir_name} via raw GitHub")
-                    else:
-                        logger.debug(f"Could not fetch {dir_name}/index.qmd via raw GitHub (status: {response.status_code if response else 'no response'})")
-                        
-                except Exception as e:
-                    logger.warning(f"Error fetching publication {dir_name} via raw GitHub: {e}")
-                    continue
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = executor.map(
+                    lambda dir_name: self._fetch_publication_via_raw_github(dir_name, ctx),
+                    known_directories
+                )
+                publications = [publication for publication in results if publication]
                     
         except Exception as e:
             logger.error(f"Error in raw GitHub fallback: {e}")
             
         return publications
     
-    def _safe_request(self, url: str) -> Optional[requests.Response]:
-        """Make a safe HTTP request with error handling."""
+    def _list_publication_directories(self, tree: List[Dict], ctx: MemberContext) -> Dict[str, Dict]:
+        """List publication directories with their tree SHA and featured image names."""
+        # Only direct children of the publications directory are publications
+        prefix = f"{ctx.publications_path}/"
+        directory_shas = {}
+        directory_files = {}
+        for entry in tree:
+            if not entry['path'].startswith(prefix):
+                continue
+            parts = entry['path'][len(prefix):].split('/')
+            if parts[0].startswith('_'):
+                continue
+            if entry['type'] == 'tree' and len(parts) == 1:
+                directory_shas[parts[0]] = entry['sha']
+            elif entry['type'] == 'blob' and len(parts) == 2:
+                directory_files.setdefault(parts[0], []).append(parts[1])
+        
+        directories = {}
+        for dir_name, filenames in directory_files.items():
+            if 'index.qmd' in filenames:
+                directories[dir_name] = {
+                    'sha': directory_shas.get(dir_name),
+                    'images': [name for name in filenames if FEATURED_IMAGE_RE.match(name)]
+                }
+        return directories
+    
+    def _fetch_publication_via_raw_github(self, dir_name: str, ctx: MemberContext,
+                                          image_names: Optional[List[str]] = None,
+                                          directory_sha: Optional[str] = None) -> Optional[Dict]:
+        """Fetch a single publication directory via raw GitHub URLs.
+        
+        When ``image_names`` is known from a tree listing no image probing is needed, and a
+        ``directory_sha`` matching the cached one skips the fetch entirely.
+        """
         try:
-            response = self.session.get(url, timeout=30)
-            return response
-        except requests.RequestException as e:
-            logger.warning(f"Request failed for {url}: {e}")
+            cached_publication = self._cached_publication(ctx, dir_name, directory_sha)
+            if cached_publication:
+                return cached_publication
+            
+            # Try to fetch index.qmd from this directory; the contents API is only worth
+            # trying when the listing came from the (reachable) tree API
+            dir_path = f"{ctx.publications_path}/{dir_name}"
+            index_url = f"{ctx.raw_base_url}/{dir_path}/index.qmd"
+            api_url = f"{ctx.api_base_url}/contents/{dir_path}/index.qmd" if directory_sha else None
+            logger.debug(f"Trying publication URL: {index_url}")
+            
+            # Only cache the response itself when there is no directory entry to hold it
+            content = self._fetch_index_qmd(index_url, api_url, cache=not directory_sha)
+            if content is None:
+                logger.debug(f"Could not fetch {dir_name}/index.qmd via raw GitHub")
+                return None
+            
+            # Try to find associated image files
+            image_files = []
+            if image_names is not None:
+                for img_filename in image_names:
+                    image_files.append({
+                        'name': img_filename,
+                        'download_url': f"{ctx.raw_base_url}/{dir_path}/{img_filename}",
+                        'github_path': f"{dir_path}/{img_filename}"
+                    })
+            else:
+                image_info = self._find_featured_image_via_raw_github(dir_name, ctx)
+                if image_info:
+                    image_files.append(image_info)
+            
+            # Parse the publication content
+            source_url = f"{ctx.html_base_url}/{dir_path}/index.qmd"
+            github_path = f"{dir_path}/index.qmd"
+            publication_data = self._build_publication(content, dir_name, source_url, github_path, image_files, ctx.member)
+            if not publication_data:
+                return None
+            
+            self._remember_directory(ctx, dir_name, directory_sha, content, source_url, github_path, image_files)
+            
+            logger.info(f"Successfully fetched publication {dir_name} via raw GitHub")
+            return publication_data
+            
+        except Exception as e:
+            logger.warning(f"Error fetching publication {dir_name} via raw GitHub: {e}")
             return None
     
-    def _parse_posts_from_github_api(self, api_response: List[Dict], username: str, repo_name: str, publications_path: str, member: Dict) -> List[Dict]:
-        """Parse publication directories from GitHub API response."""
-        publications = []
+    def _find_featured_image_via_raw_github(self, dir_name: str, ctx: MemberContext) -> Optional[Dict]:
+        """Probe all candidate featured image extensions concurrently with HEAD requests."""
+        dir_path = f"{ctx.publications_path}/{dir_name}"
+        candidates = []
+        for ext in IMAGE_EXTENSIONS:
+            img_filename = f"featured.{ext}"
+            candidates.append((img_filename, f"{ctx.raw_base_url}/{dir_path}/{img_filename}"))
         
-        logger.info(f"Parsing {len(api_response)} items from {username}'s GitHub repository")
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            responses = list(executor.map(lambda candidate: self._safe_request(candidate[1], method='HEAD'), candidates))
         
-        for item in api_response:
-            if item['type'] == 'dir' and not item['name'].startswith('_'):
-                # This is a publication directory - check if it contains index.qmd
-                try:
-                    logger.debug(f"Checking publication directory: {item['name']}")
-                    subdir_url = item['url']
-                    subdir_response = self._safe_request(subdir_url)
-                    
-                    if subdir_response and subdir_response.status_code == 200:
-                        subdir_items = subdir_response.json()
-                        
-                        # Look for index.qmd in this directory
-                        index_qmd = None
-                        image_files = []
-                        
-                        for subitem in subdir_items:
-                            if subitem['type'] == 'file':
-                                if subitem['name'] == 'index.qmd':
-                                    index_qmd = subitem
-                                elif subitem['name'].lower().startswith('featured.') and subitem['name'].lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg')):
-                                    image_files.append(subitem)
-                        
-                        if index_qmd:
-                            # This directory contains a publication - process it
-                            publication_data = self._process_publication_directory(
-                                item['name'], index_qmd, image_files, username, repo_name, publications_path, member
-                            )
-                            if publication_data:
-                                publications.append(publication_data)
-                        else:
-                            logger.debug(f"Directory {item['name']} does not contain index.qmd, skipping")
-                    else:
-                        logger.warning(f"Could not fetch directory contents for {item['name']}")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing directory {item['name']}: {e}")
-                    continue
+        # Keep the extension preference order - only need one featured image
+        for (img_filename, img_url), img_response in zip(candidates, responses):
+            if img_response and img_response.status_code == 200:
+                logger.debug(f"Found image file: {img_filename}")
+                return {
+                    'name': img_filename,
+                    'download_url': img_url,
+                    'github_path': f"{dir_path}/{img_filename}"
+                }
         
-        return publications
+        return None
     
-    def _process_publication_directory(self, dir_name: str, index_qmd: Dict, image_files: List[Dict], 
-                                     username: str, repo_name: str, publications_path: str, member: Dict) -> Optional[Dict]:
-        """Process a publication directory containing index.qmd and associated files."""
+    def _safe_request(self, url: str, method: str = 'GET', headers: Optional[Dict] = None,
+                      stream: bool = False) -> Optional[requests.Response]:
+        """Make a safe HTTP request with error handling.
+        
+        Streamed responses must be closed by the caller.
+        """
+        is_api = url.startswith(GITHUB_HOSTS[0])
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if is_api:
+                self._wait_for_rate_limit_reset()
+            try:
+                response = self.session.request(method, url, headers=headers, timeout=30,
+                                                allow_redirects=True, stream=stream)
+            except requests.RequestException as e:
+                logger.warning(f"Request failed for {url}: {e}")
+                return None
+            
+            if is_api:
+                self._record_rate_limit(response)
+            
+            wait = self._rate_limit_retry_delay(response, attempt)
+            if wait is None or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            logger.warning(f"Rate limited on {url} (status {response.status_code}), retrying in {wait:.1f}s")
+            response.close()
+            time.sleep(wait)
+        
+        return response
+    
+    def _get_content(self, url: str, cache: bool = True) -> Tuple[Optional[int], bytes]:
+        """GET a URL and return its status code and body (None and b'' if the request failed).
+        
+        Cached requests are sent with If-None-Match; a 304 reply returns the body stored with
+        the ETag instead (304s do not count against rate limits).
+        """
+        use_cache = cache and self.cache_path is not None
+        cached = self._cache_get('responses', url) if use_cache else None
+        headers = {'If-None-Match': cached['etag']} if cached else None
+        
+        response = self._safe_request(url, headers=headers)
+        if response is None:
+            return None, b''
+        
+        if cached and response.status_code == 304:
+            logger.debug(f"Not modified, using cached response for {url}")
+            return 200, cached['body'].encode('utf-8')
+        
+        if use_cache and response.status_code == 200 and response.headers.get('ETag'):
+            try:
+                self._cache_put('responses', url, {
+                    'etag': response.headers['ETag'],
+                    'body': response.content.decode('utf-8')
+                })
+            except UnicodeDecodeError:
+                # Only text bodies (API JSON, index.qmd) are cached
+                pass
+        return response.status_code, response.content
+    
+    def _record_rate_limit(self, response: requests.Response) -> None:
+        """Remember when the API rate limit resets once it is (nearly) used up."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            self._rate_limit_reset = float(reset) if int(remaining) < RATE_LIMIT_MIN_REMAINING else None
+        except ValueError:
+            pass
+    
+    def _wait_for_rate_limit_reset(self) -> None:
+        """Sleep until the API rate limit resets, if it is exhausted and resets soon."""
+        if self._rate_limit_reset is None:
+            return
+        wait = self._rate_limit_reset - time.time()
+        if 0 < wait <= MAX_RATE_LIMIT_WAIT:
+            logger.info(f"GitHub API rate limit exhausted, waiting {wait:.0f}s for reset")
+            time.sleep(wait)
+    
+    def _rate_limit_retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Return how long to wait before retrying a rate-limited response, or None not to retry."""
+        if response.status_code not in (403, 429):
+            return None
+        
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            # Secondary rate limits tell us how long to back off
+            wait = float(retry_after)
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            # Primary rate limit exhausted - wait for the reset
+            wait = float(response.headers.get('X-RateLimit-Reset', 0)) - time.time()
+        elif response.status_code == 429 or 'secondary rate limit' in response.text.lower():
+            # Exponential backoff with jitter
+            wait = 2 ** attempt + random.uniform(0, 1)
+        else:
+            # A genuine permission error - retrying will not help
+            return None
+        
+        if wait > MAX_RATE_LIMIT_WAIT:
+            return None
+        return max(wait, 0)
+    
+    def _parse_posts_from_github_api(self, api_response: List[Dict], ctx: MemberContext) -> List[Dict]:
+        """Parse publication directories from GitHub API response."""
+        logger.info(f"Parsing {len(api_response)} items from {ctx.username}'s GitHub repository")
+        
+        directories = [item for item in api_response if item['type'] == 'dir' and not item['name'].startswith('_')]
+        
+        # Directory listings are independent, so fetch them concurrently (results keep listing order)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda item: self._fetch_publication_from_api_directory(item, ctx),
+                directories
+            )
+            return [publication for publication in results if publication]
+    
+    def _fetch_publication_from_api_directory(self, item: Dict, ctx: MemberContext) -> Optional[Dict]:
+        """Fetch a publication directory listing and process it if it contains index.qmd."""
         try:
-            # Fetch the index.qmd content
-            content_response = self._safe_request(index_qmd['url'])
+            # An unchanged directory SHA means nothing in it changed since the last run
+            cached_publication = self._cached_publication(ctx, item['name'], item.get('sha'))
+            if cached_publication:
+                return cached_publication
             
-            if not content_response or content_response.status_code != 200:
-                logger.warning(f"Could not fetch index.qmd for directory {dir_name}")
+            logger.debug(f"Checking publication directory: {item['name']}")
+            subdir_url = item['url']
+            status, body = self._get_content(subdir_url)
+            
+            if status != 200:
+                logger.warning(f"Could not fetch directory contents for {item['name']}")
                 return None
-                
-            content_data = content_response.json()
-            content_b64 = content_data.get('content', '')
-            content_decoded = base64.b64decode(content_b64).decode('utf-8')
             
-            # Parse the publication metadata and content
-            publication_data = self._parse_qmd_content(content_decoded, 'index.qmd', member)
-            if not publication_data:
+            subdir_items = json_loads(body)
+            
+            # Look for index.qmd in this directory
+            index_qmd = None
+            image_files = []
+            
+            for subitem in subdir_items:
+                if subitem['type'] == 'file':
+                    if subitem['name'] == 'index.qmd':
+                        index_qmd = subitem
+                    elif FEATURED_IMAGE_RE.match(subitem['name']):
+                        image_files.append(subitem)
+            
+            if not index_qmd:
+                logger.debug(f"Directory {item['name']} does not contain index.qmd, skipping")
                 return None
             
-            # Add directory-specific information
-            publication_data['directory_name'] = dir_name
-            publication_data['source_url'] = index_qmd['html_url']
-            publication_data['github_path'] = index_qmd['path']
-            publication_data['image_files'] = []
+            # This directory contains a publication - process it
+            return self._process_publication_directory(
+                item['name'], index_qmd, image_files, ctx, directory_sha=item.get('sha')
+            )
+                
+        except Exception as e:
+            logger.error(f"Error processing directory {item['name']}: {e}")
+            return None
+    
+    def _fetch_index_qmd(self, download_url: Optional[str], api_url: Optional[str],
+                         cache: bool = True) -> Optional[str]:
+        """Fetch index.qmd text from its raw download URL, falling back to the contents API."""
+        # Fetch the raw index.qmd content directly - no extra API call or base64 decoding needed
+        if download_url:
+            status, body = self._get_content(download_url, cache=cache)
+            if status == 200:
+                return body.decode('utf-8', 'replace')
+        
+        if not api_url:
+            return None
+        
+        # Fall back to the contents API, which returns the file base64-encoded
+        # (wrapped at 60 columns; a2b_base64 skips the newlines in C)
+        status, body = self._get_content(api_url, cache=cache)
+        if status != 200:
+            return None
+        
+        content_data = json_loads(body)
+        content_b64 = content_data.get('content', '')
+        return binascii.a2b_base64(content_b64).decode('utf-8')
+    
+    def _directory_cache_key(self, ctx: MemberContext, dir_name: str) -> str:
+        """Key of a publication directory in the sync cache."""
+        return f"{ctx.username}/{ctx.repo_name}/{ctx.publications_path}/{dir_name}"
+    
+    def _cached_publication(self, ctx: MemberContext, dir_name: str, sha: Optional[str]) -> Optional[Dict]:
+        """Rebuild a publication from the sync cache if its directory SHA is unchanged."""
+        cached = self._cache_get('directories', self._directory_cache_key(ctx, dir_name))
+        if not sha or not cached or cached['sha'] != sha:
+            return None
+        
+        logger.debug(f"Directory {dir_name} unchanged since last sync, using cached publication")
+        return self._build_publication(cached['content'], dir_name, cached['source_url'],
+                                       cached['github_path'], cached['image_files'], ctx.member)
+    
+    def _remember_directory(self, ctx: MemberContext, dir_name: str, sha: Optional[str], content: str,
+                            source_url: str, github_path: str, image_files: List[Dict]) -> None:
+        """Cache a fetched publication directory so an unchanged SHA skips it next run."""
+        if not sha:
+            return
+        self._cache_put('directories', self._directory_cache_key(ctx, dir_name), {
+            'sha': sha,
+            'content': content,
+            'source_url': source_url,
+            'github_path': github_path,
+            'image_files': image_files
+        })
+    
+    def _process_publication_directory(self, dir_name: str, index_qmd: Dict, image_files: List[Dict], 
+                                     ctx: MemberContext, directory_sha: Optional[str] = None) -> Optional[Dict]:
+        """Process a publication directory containing index.qmd and associated files."""
+        try:
+            content_decoded = self._fetch_index_qmd(index_qmd.get('download_url'), index_qmd['url'],
+                                                    cache=not directory_sha)
+            if content_decoded is None:
+                logger.warning(f"Could not fetch index.qmd for directory {dir_name}")
+                return None
             
             # Process associated image files
-            for img_file in image_files:
-                image_info = {
+            image_infos = [
+                {
                     'name': img_file['name'],
                     'download_url': img_file['download_url'],
                     'github_path': img_file['path']
                 }
-                publication_data['image_files'].append(image_info)
+                for img_file in image_files
+            ]
+            
+            publication_data = self._build_publication(content_decoded, dir_name, index_qmd['html_url'],
+                                                       index_qmd['path'], image_infos, ctx.member)
+            
+            if publication_data:
+                self._remember_directory(ctx, dir_name, directory_sha, content_decoded,
+                                         index_qmd['html_url'], index_qmd['path'], image_infos)
             
             return publication_data
             
@@ -255,31 +846,45 @@ class MemberPostSync:
             logger.error(f"Error processing publication directory {dir_name}: {e}")
             return None
     
+    def _build_publication(self, content: str, dir_name: str, source_url: str, github_path: str,
+                           image_files: List[Dict], member: Dict) -> Optional[Dict]:
+        """Parse index.qmd content and attach the directory-specific information."""
+        # Parse the publication metadata and content
+        publication_data = self._parse_qmd_content(content, 'index.qmd', member)
+        if not publication_data:
+            return None
+        
+        # Add directory-specific information
+        publication_data['directory_name'] = dir_name
+        publication_data['source_url'] = source_url
+        publication_data['github_path'] = github_path
+        publication_data['image_files'] = list(image_files)
+        
+        return publication_data
+    
     def _parse_qmd_content(self, content: str, filename: str, member: Dict) -> Optional[Dict]:
         """Parse a Quarto markdown file content."""
         try:
             # Split YAML frontmatter from content
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    yaml_content = parts[1].strip()
-                    markdown_content = parts[2].strip()
-                    
-                    # Parse YAML frontmatter
-                    frontmatter = yaml.safe_load(yaml_content)
-                    
-                    # Handle author field - preserve original format in original_frontmatter
-                    author_value = frontmatter.get('author', member['name'])
-                    
-                    return {
-                        'title': frontmatter.get('title', filename.replace('.qmd', '').title()),
-                        'author': author_value,
-                        'categories': frontmatter.get('categories', []),
-                        'content': markdown_content,
-                        'filename': filename,
-                        'original_frontmatter': frontmatter
-                    }
-                    
+            match = FRONTMATTER_RE.match(content)
+            if match:
+                yaml_content, markdown_content = match.groups()
+                
+                # Parse YAML frontmatter
+                frontmatter = _load_yaml(yaml_content or '') or {}
+                
+                # Handle author field - preserve original format in original_frontmatter
+                author_value = frontmatter.get('author', member['name'])
+                
+                return {
+                    'title': frontmatter.get('title', filename.replace('.qmd', '').title()),
+                    'author': author_value,
+                    'categories': frontmatter.get('categories', []),
+                    'content': markdown_content.strip(),
+                    'filename': filename,
+                    'original_frontmatter': frontmatter
+                }
+                
             # If no frontmatter, treat as plain markdown
             return {
                 'title': filename.replace('.qmd', '').replace('-', ' ').title(),
@@ -325,13 +930,13 @@ class MemberPostSync:
         # Default to posts subdirectory for backward compatibility
         return 'posts'
     
-    def _create_local_post(self, publication: Dict, member: Dict) -> Tuple[Path, str, List[Tuple[Path, str]]]:
+    def _create_local_post(self, publication: Dict, ctx: MemberContext) -> Tuple[Path, str, List[Tuple[Path, str]]]:
         """Create a local publication directory from fetched publication data."""
+        member = ctx.member
         directory_name = publication.get('directory_name', f"publication-{datetime.now().strftime('%Y%m%d%H%M%S')}")
         
         # Create directory path - use the original directory name prefixed with username
-        local_dir_name = f"{member['username'].lower()}-{directory_name}"
-        destination_dir = self.base_publications_dir / local_dir_name
+        destination_dir = self.base_publications_dir / f"{ctx.local_dir_prefix}{directory_name}"
         
         # Create the index.qmd path
         index_path = destination_dir / 'index.qmd'
@@ -347,16 +952,17 @@ class MemberPostSync:
         elif not isinstance(author_value, list):
             author_value = [str(author_value)]
         
+        # Ensure member-publication category is present and merge in the original
+        # categories that are not already listed
+        categories = _as_list(publication.get('categories', ['research', 'member-publication']))
+        original_cats = _as_list(original_fm.get('categories'))
+        
         frontmatter = {
             'title': publication.get('title', 'Untitled Publication'),
             'author': author_value,
-            'categories': publication.get('categories', ['research', 'member-publication'])
+            'categories': _append_missing(categories, ['member-publication', *original_cats])
         }
         
-        # Ensure member-publication category is present
-        if 'member-publication' not in frontmatter['categories']:
-            frontmatter['categories'].append('member-publication')
-        
         # Add source metadata
         frontmatter['source'] = {
             'member': member['name'],
@@ -370,25 +976,12 @@ class MemberPostSync:
         for key, value in original_fm.items():
             if key not in frontmatter and key != 'categories':
                 frontmatter[key] = value
-                
-        # Handle categories merging
-        if 'categories' in original_fm:
-            original_cats = original_fm['categories'] if isinstance(original_fm['categories'], list) else [original_fm['categories']]
-            for cat in original_cats:
-                if cat not in frontmatter['categories']:
-                    frontmatter['categories'].append(cat)
         
-        # Get content
-        content = publication.get('content', '')
-        
-        # Add attribution if configured
-        sync_config = self.config.get('sync_config', {})
-        if sync_config.get('add_attribution', True):
-            attribution = f"\n\n---\n\n*This publication was originally published by [{member['name']}]({member['profile_url']}) and automatically synced to the McPherson Lab website.*"
-            content += attribution
+        # Get content, with the attribution (empty when disabled) appended
+        content = publication.get('content', '') + ctx.attribution
         
         # Create the full post content
-        yaml_header = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+        yaml_header = _emit_frontmatter(frontmatter)
         full_content = f"---\n{yaml_header}---\n\n{content}"
         
         # Prepare image files for download
@@ -401,26 +994,85 @@ class MemberPostSync:
         return index_path, full_content, image_downloads
     
     def _download_image_file(self, local_path: Path, download_url: str) -> bool:
-        """Download an image file from GitHub."""
+        """Download an image file from GitHub, streaming it to disk."""
+        tmp_path = local_path.with_name(local_path.name + '.tmp')
         try:
-            response = self._safe_request(download_url)
-            if response and response.status_code == 200:
-                # Ensure parent directory exists
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Write the image file
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
-                
-                logger.debug(f"Downloaded image file: {local_path}")
-                return True
-            else:
+            response = self._safe_request(download_url, stream=True)
+            if response is None:
                 logger.warning(f"Failed to download image from {download_url}")
                 return False
+            
+            with response:
+                if response.status_code != 200:
+                    logger.warning(f"Failed to download image from {download_url}")
+                    return False
+                
+                # Ensure parent directory exists
+                self._ensure_directory(local_path.parent)
+                
+                # Write to a temporary sibling and swap it in, so an interrupted
+                # download never leaves a half-written image behind
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(tmp_path, local_path)
+            
+            logger.debug(f"Downloaded image file: {local_path}")
+            return True
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             logger.error(f"Error downloading image file {download_url}: {e}")
             return False
     
+    def _ensure_directory(self, path: Path) -> None:
+        """Create a directory (and parents) once per run."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+    
+    def _write_text_atomic(self, path: Path, content: str) -> None:
+        """Write a text file via a temporary sibling so readers never see a partial file."""
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _is_content_unchanged(self, index_path: Path, content: str, content_hash: str) -> bool:
+        """Check whether an existing index.qmd already holds the given content.
+        
+        While the file's mtime and size match the cached entry the cached hash is trusted,
+        so the file only needs to be read when it was modified outside the sync. This only
+        saves reads in a persistent working tree: a fresh checkout (as in the sync workflow)
+        gives every file a new mtime, so there the existing file is always read and compared.
+        """
+        stat = index_path.stat()
+        cached = self._cache_get('files', str(index_path))
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['hash'] == content_hash
+        
+        # Read existing content to compare
+        with open(index_path, 'r', encoding='utf-8') as f:
+            existing_content = f.read()
+        
+        # Simple comparison - you could add more sophisticated comparison
+        if existing_content.strip() == content.strip():
+            self._remember_file_hash(index_path, content_hash)
+            return True
+        return False
+    
+    def _remember_file_hash(self, index_path: Path, content_hash: str) -> None:
+        """Record the content hash of a written index.qmd along with its stat signature."""
+        stat = index_path.stat()
+        self._cache_put('files', str(index_path), {
+            'hash': content_hash,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size
+        })
+    
     def sync_member_posts(self, member_username: Optional[str] = None) -> None:
         """Sync publications for all members or a specific member."""
         members = self.config.get('members', [])
@@ -438,29 +1090,40 @@ class MemberPostSync:
         
         # Ensure base publications directory exists
         if not self.dry_run:
-            self.base_publications_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(self.base_publications_dir)
         
-        for member in active_members:
-            try:
-                self._sync_member_posts(member)
-            except Exception as e:
-                logger.error(f"Error syncing publications for {member['username']}: {e}")
-                continue
+        # Members live in separate repositories, so sync them concurrently
+        if active_members:
+            with ThreadPoolExecutor(max_workers=min(len(active_members), MEMBER_WORKERS)) as executor:
+                futures = [(member, executor.submit(self._sync_member_posts, member)) for member in active_members]
+                for member, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Error syncing publications for {member['username']}: {e}")
+                        continue
+        
+        # Only a full run knows which entries are stale; a --member run keeps everyone else's
+        if member_username is None:
+            self._prune_cache()
+        self._save_cache()
     
     def _sync_member_posts(self, member: Dict) -> None:
         """Sync publications for a single member."""
         username = member['username']
         logger.info(f"Syncing publications for {username}")
         
+        ctx = self._build_member_context(member)
+        
         # Fetch publications from member's site
-        publications = self._get_posts_from_member_site(member)
+        publications = self._get_posts_from_member_site(ctx)
         
         if not publications:
             logger.info(f"No publications found for {username}")
             return
         
         # Limit publications if configured
-        max_posts = self.config.get('sync_config', {}).get('max_posts_per_member', 50)
+        max_posts = self._max_posts
         if len(publications) > max_posts:
             logger.info(f"Limiting to {max_posts} most recent publications for {username}")
             publications = publications[:max_posts]
@@ -469,10 +1132,11 @@ class MemberPostSync:
         created_count = 0
         updated_count = 0
         skipped_count = 0
+        pending_image_downloads = []
         
         for publication in publications:
             try:
-                index_path, content, image_downloads = self._create_local_post(publication, member)
+                index_path, content, image_downloads = self._create_local_post(publication, ctx)
                 
                 if self.dry_run:
                     logger.info(f"[DRY RUN] Would create/update publication directory: {index_path.parent}")
@@ -481,14 +1145,11 @@ class MemberPostSync:
                         logger.info(f"[DRY RUN] Would download image: {img_path}")
                     logger.debug(f"[DRY RUN] Content preview:\n{content[:200]}...")
                 else:
+                    content_hash = _content_hash(content)
+                    
                     # Check if index.qmd already exists
                     if index_path.exists():
-                        # Read existing content to compare
-                        with open(index_path, 'r', encoding='utf-8') as f:
-                            existing_content = f.read()
-                        
-                        # Simple comparison - you could add more sophisticated comparison
-                        if existing_content.strip() == content.strip():
+                        if self._is_content_unchanged(index_path, content, content_hash):
                             logger.debug(f"No changes detected for {index_path}")
                             skipped_count += 1
                             continue
@@ -500,21 +1161,27 @@ class MemberPostSync:
                         created_count += 1
                     
                     # Ensure destination directory exists
-                    index_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._ensure_directory(index_path.parent)
                     
                     # Write the index.qmd file
-                    with open(index_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    self._write_text_atomic(index_path, content)
+                    self._remember_file_hash(index_path, content_hash)
                     
-                    # Download image files
-                    for img_path, img_url in image_downloads:
-                        if not self._download_image_file(img_path, img_url):
-                            logger.warning(f"Failed to download image: {img_path}")
+                    # Queue image files for download
+                    pending_image_downloads.extend(image_downloads)
                         
             except Exception as e:
                 logger.error(f"Error processing publication {publication.get('directory_name', 'unknown')}: {e}")
                 continue
         
+        # Image downloads are independent of each other, so run them concurrently
+        if pending_image_downloads:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = executor.map(lambda download: self._download_image_file(*download), pending_image_downloads)
+                for (img_path, img_url), downloaded in zip(pending_image_downloads, results):
+                    if not downloaded:
+                        logger.warning(f"Failed to download image: {img_path}")
+        
         if not self.dry_run:
             logger.info(f"Sync completed for {username}: {created_count} created, {updated_count} updated, {skipped_count} skipped")
 
@@ -526,6 +1193,8 @@ def main():
                        help='Sync publications for a specific member only')
     parser.add_argument('--config', type=str, default='members.yml',
                        help='Path to members configuration file')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update the ETag/SHA sync cache')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
@@ -535,7 +1204,8 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Initialize the sync tool
-    sync_tool = MemberPostSync(config_path=args.config, dry_run=args.dry_run)
+    sync_tool = MemberPostSync(config_path=args.config, dry_run=args.dry_run,
+                               cache_path=None if args.no_cache else DEFAULT_CACHE_PATH)
     
     # Run synchronization
     sync_tool.sync_member_posts(member_username=args.member)